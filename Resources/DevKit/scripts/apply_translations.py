@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Apply an English → target language translation map to Localizable.xcstrings.
+The map is a JSON object such as {"Remove Icon": "移除图标"}; only missing or
+empty target values are filled. A vendor drop keyed by language, such as
+{"ko": {"Remove Icon": "아이콘 제거"}, "de": {...}}, applies every language.
+"""
+
+import argparse
+import json
+import sys
+
+from i18n_tools import (
+    apply_translation_map,
+    default_file_path,
+    load_strings,
+    print_apply_summary,
+    save_strings,
+)
+
+
+def is_flat_map(value) -> bool:
+    """True for a JSON object mapping English keys to translation strings."""
+    return isinstance(value, dict) and all(isinstance(item, str) for item in value.values())
+
+
+def main(argv=None, prog=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description=__doc__.strip(),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("map", help="JSON file with the translation map")
+    parser.add_argument("file", nargs="?", default=default_file_path())
+    parser.add_argument("-l", "--language", default="zh-Hans", help="target language")
+    args = parser.parse_args(argv)
+
+    try:
+        with open(args.map, "r", encoding="utf-8") as f:
+            translation_map = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"❌ Could not read translation map {args.map}: {e}")
+        return 1
+
+    if is_flat_map(translation_map):
+        translation_maps = {args.language: translation_map}
+    elif isinstance(translation_map, dict) and all(map(is_flat_map, translation_map.values())):
+        translation_maps = translation_map
+    else:
+        print(
+            f"❌ Translation map {args.map} must be an object of English → translation "
+            "strings, or of such objects keyed by language"
+        )
+        return 1
+
+    data = load_strings(args.file)
+    applied = {
+        language: apply_translation_map(data, language_map, target_language=language)
+        for language, language_map in translation_maps.items()
+    }
+    if any(applied.values()):
+        save_strings(args.file, data)
+
+    for language, count in applied.items():
+        print_apply_summary(count, args.file, language)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Fail when the i18n CLI starts slower than its time budget.
+
+Times `i18n --help` and a no-op `i18n check` (against a tiny, complete
+catalog) in fresh interpreters and compares the median against a budget in
+milliseconds. Also verifies that `--help` imports no subcommand module and
+that failures reach the exit status, which pre-commit hooks depend on.
+Works against i18n.py or a zipapp built with `make i18n`.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from i18n import COMMANDS
+
+DEFAULT_TARGET = os.path.join(os.path.dirname(os.path.abspath(__file__)), "i18n.py")
+
+# Generous enough for a cold interpreter on CI hosts; the import-time regression
+# this guards against (eagerly loading every subcommand) costs far more.
+DEFAULT_HELP_BUDGET_MS = 80.0
+DEFAULT_CHECK_BUDGET_MS = 120.0
+
+NOOP_CATALOG = {
+    "sourceLanguage": "en",
+    "strings": {
+        "OK": {
+            "localizations": {
+                "en": {"stringUnit": {"state": "translated", "value": "OK"}},
+            }
+        }
+    },
+    "version": "1.0",
+}
+
+# Same catalog with an English cell still in state "new": `check` must fail.
+FAILING_CATALOG = {
+    "sourceLanguage": "en",
+    "strings": {
+        "OK": {
+            "localizations": {
+                "en": {"stringUnit": {"state": "new", "value": "OK"}},
+            }
+        }
+    },
+    "version": "1.0",
+}
+
+
+def time_command(command: list, runs: int) -> float:
+    """Median wall time in milliseconds, after one warm-up run for bytecode caches."""
+    samples = []
+    for index in range(runs + 1):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, capture_output=True)
+        elapsed = (time.perf_counter() - start) * 1000
+        if index:
+            samples.append(elapsed)
+    return statistics.median(samples)
+
+
+def eager_imports(command: list) -> list:
+    """Return subcommand modules imported while running `command`."""
+    result = subprocess.run(
+        [command[0], "-X", "importtime", *command[1:]],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    lazy = {module for module, _ in COMMANDS.values()} | {"i18n_tools"}
+    imported = {line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines()}
+    return sorted(imported & lazy)
+
+
+def exit_status(command: list) -> int:
+    return subprocess.run(command, capture_output=True).returncode
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("target", nargs="?", default=DEFAULT_TARGET)
+    parser.add_argument("-n", "--runs", type=int, default=10)
+    parser.add_argument("--help-budget-ms", type=float, default=DEFAULT_HELP_BUDGET_MS)
+    parser.add_argument("--check-budget-ms", type=float, default=DEFAULT_CHECK_BUDGET_MS)
+    args = parser.parse_args(argv)
+
+    python = sys.executable
+    failures = []
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        catalog = os.path.join(temp_dir, "Localizable.xcstrings")
+        with open(catalog, "w", encoding="utf-8") as f:
+            json.dump(NOOP_CATALOG, f)
+        failing_catalog = os.path.join(temp_dir, "Failing.xcstrings")
+        with open(failing_catalog, "w", encoding="utf-8") as f:
+            json.dump(FAILING_CATALOG, f)
+
+        baseline = time_command([python, "-c", "pass"], args.runs)
+        print(f"interpreter baseline: {baseline:6.1f} ms")
+
+        cases = [
+            ("--help", [python, args.target, "--help"], args.help_budget_ms),
+            ("check (no-op)", [python, args.target, "check", catalog], args.check_budget_ms),
+        ]
+        for name, command, budget in cases:
+            median = time_command(command, args.runs)
+            status = "ok" if median <= budget else "OVER BUDGET"
+            print(f"{name:<20} {median:6.1f} ms (budget {budget:.0f} ms) {status}")
+            if median > budget:
+                failures.append(name)
+
+        eager = eager_imports([python, args.target, "--help"])
+        if eager:
+            print(f"--help imported subcommand modules eagerly: {', '.join(eager)}")
+            failures.append("lazy imports")
+
+        expected_failures = [
+            ("check (incomplete)", [python, args.target, "check", failing_catalog]),
+            ("unknown command", [python, args.target, "bogus"]),
+        ]
+        for name, command in expected_failures:
+            status = exit_status(command)
+            print(f"{name:<20} exit {status} {'ok' if status else 'EXPECTED NON-ZERO'}")
+            if not status:
+                failures.append(name)
+
+    if failures:
+        print(f"❌ Startup checks failed: {', '.join(failures)}")
+        return 1
+    print("✅ Startup within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,22 +3,36 @@
 Report translation completeness and optionally prune stale keys.
 """
 
+import argparse
 import sys
 
 from i18n_tools import (
+    LocaleFallbacks,
     default_file_path,
+    expand_strings,
     find_incomplete_translations,
     load_strings,
+    prune_stale_strings,
     save_strings,
 )
 
 
-if __name__ == "__main__":
-    file_path = sys.argv[1] if len(sys.argv) > 1 else default_file_path()
+def main(argv=None, prog=None) -> int:
+    parser = argparse.ArgumentParser(prog=prog, description=__doc__.strip())
+    parser.add_argument("file", nargs="?", default=default_file_path())
+    parser.add_argument(
+        "--effective",
+        action="store_true",
+        help="count values inherited through locale fallback chains as translated",
+    )
+    args = parser.parse_args(argv)
+    file_path = args.file
 
     data = load_strings(file_path)
-    languages, incomplete, removed = find_incomplete_translations(data, clean_stale=True)
-
+    fallbacks = None
+    if args.effective:
+        fallbacks = LocaleFallbacks(source_language=data.get("sourceLanguage", "en"))
+    removed = prune_stale_strings(data)
     if removed:
         save_strings(file_path, data)
         print("Removed stale strings:")
@@ -27,6 +41,15 @@ if __name__ == "__main__":
     else:
         print("No stale strings found.")
 
+    # A missing English cell shows its key at runtime, so checks run on the
+    # expanded form and neither compacted nor missing anchors are reported.
+    expand_strings(data)
+    languages, incomplete, _ = find_incomplete_translations(
+        data,
+        clean_stale=False,
+        fallbacks=fallbacks,
+    )
+
     translatable_count = len(data["strings"])
     print(f"Found languages: {', '.join(languages)}")
     print(f"Total strings: {translatable_count}")
@@ -36,7 +59,11 @@ if __name__ == "__main__":
         print(f"Incomplete translations in {file_path}:")
         for key, lang, reason in incomplete:
             print(f"  {key} - {lang}: {reason}")
-        sys.exit(1)
+        return 1
 
     print(f"All translations are complete in {file_path}.")
-    sys.exit(0)
\ No newline at end of file
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,11 +7,15 @@ Exit codes:
     1 - Found untranslated strings (or file errors)
 """
 
+import argparse
 import sys
 
 from i18n_tools import (
     DEFAULT_KEEP_LANGUAGES,
+    LocaleFallbacks,
+    collect_languages,
     default_file_path,
+    expand_strings,
     find_untranslated,
     load_strings,
 )
@@ -19,16 +23,42 @@ from i18n_tools import (
 EXCEPTIONS: set[str] = {"%@", "%lld"}
 
 
-if __name__ == "__main__":
-    file_path = sys.argv[1] if len(sys.argv) > 1 else default_file_path()
+def main(argv=None, prog=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description=__doc__.strip(),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("file", nargs="?", default=default_file_path())
+    parser.add_argument(
+        "--effective",
+        action="store_true",
+        help="also check regional variants, counting values inherited "
+        "through locale fallback chains",
+    )
+    args = parser.parse_args(argv)
+    file_path = args.file
 
     print(f"📝 Checking for untranslated strings in: {file_path}\n")
     data = load_strings(file_path)
+    expand_strings(data)
+
+    target_langs = set(DEFAULT_KEEP_LANGUAGES)
+    fallbacks = None
+    if args.effective:
+        languages = collect_languages(data["strings"])
+        fallbacks = LocaleFallbacks(
+            languages,
+            source_language=data.get("sourceLanguage", "en"),
+        )
+        # Regional variants present in the catalog, e.g. es-MX alongside es.
+        target_langs |= {lang for lang in languages if len(fallbacks.chain(lang)) > 1}
 
     untranslated = find_untranslated(
         data,
-        target_langs=DEFAULT_KEEP_LANGUAGES,
+        target_langs=target_langs,
         exceptions=EXCEPTIONS,
+        fallbacks=fallbacks,
     )
 
     if untranslated:
@@ -36,8 +66,11 @@ if __name__ == "__main__":
         for item in untranslated:
             print(f"  Key: {item['key']}")
             print(f"  Missing: {', '.join(item['missing'])}\n")
-        sys.exit(1)
+        return 1
 
     print(f"✅ All strings are properly translated in {file_path}")
-    sys.exit(0)
+    return 0
+
 
+if __name__ == "__main__":
+    sys.exit(main())
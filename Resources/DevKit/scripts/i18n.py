@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Single entrypoint for the SubZen localization scripts.
+
+Each subcommand's module is imported only when that subcommand runs, so
+`i18n --help` and quick checks from pre-commit hooks pay for the interpreter
+and nothing else. Also ships as a zipapp, see `make i18n`.
+"""
+
+import importlib
+import sys
+
+# Subcommand → (module with a main(argv, prog) entrypoint, summary)
+COMMANDS = {
+    "check": ("check_translations", "report incomplete translations, prune stale keys"),
+    "untranslated": ("check_untranslated", "list strings missing in kept languages"),
+    "update": ("update_missing_i18n", "add English anchors and apply NEW_STRINGS"),
+    "apply": ("apply_translations", "apply an English → language translation map"),
+    "history": ("i18n_history", "translation coverage across git history"),
+    "expansion": ("i18n_expansion", "flag translations at risk of truncation"),
+    "compact": ("i18n_compact", "drop English anchors and identity translations"),
+    "key": ("i18n_index", "read or edit one key via the byte-offset index"),
+}
+
+
+def usage() -> str:
+    width = max(len(name) for name in COMMANDS)
+    lines = [
+        "usage: i18n <command> [options] [file]",
+        "",
+        "commands:",
+    ]
+    lines += [f"  {name:<{width}}  {summary}" for name, (_, summary) in COMMANDS.items()]
+    lines += ["", "Run `i18n <command> --help` for command options."]
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print(usage(), file=sys.stderr)
+        return 2
+    if argv[0] in ("-h", "--help"):
+        print(usage())
+        return 0
+
+    command, rest = argv[0], argv[1:]
+    if command not in COMMANDS:
+        print(f"i18n: unknown command '{command}'\n", file=sys.stderr)
+        print(usage(), file=sys.stderr)
+        return 2
+
+    module = importlib.import_module(COMMANDS[command][0])
+    return module.main(rest, prog=f"i18n {command}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
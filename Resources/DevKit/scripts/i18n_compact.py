@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Compact Localizable.xcstrings by dropping cells Xcode can derive.
+
+Removes English anchors whose value equals the key and collapses rows where
+every language repeats English (such as URLs) to shouldTranslate=false.
+Runtime strings are unchanged: a missing English cell resolves to its key in
+Xcode, and the check scripts expand anchors back on load the same way.
+`i18n update` keeps a compacted catalog compacted.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+
+from i18n_tools import compact_strings, default_file_path, save_strings
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+
+def parse_seconds(text: str, repeat: int = 20) -> float:
+    """Best-of-N json.loads time, the dominant cost of load_strings."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        json.loads(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def object_count(value: Any) -> int:
+    """Number of JSON containers and scalars, a proxy for in-memory size."""
+    if isinstance(value, dict):
+        return 1 + sum(object_count(item) for item in value.values())
+    if isinstance(value, list):
+        return 1 + sum(object_count(item) for item in value)
+    return 1
+
+
+def main(argv: list[str] | None = None, prog: str | None = None) -> int:
+    parser = argparse.ArgumentParser(prog=prog, description=__doc__.strip().splitlines()[0])
+    parser.add_argument("file", nargs="?", default=default_file_path())
+    parser.add_argument("-n", "--dry-run", action="store_true", help="report savings only")
+    args = parser.parse_args(argv)
+
+    try:
+        with open(args.file, "r", encoding="utf-8") as f:
+            before_text = f.read()
+        data = json.loads(before_text)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"❌ Could not read {args.file}: {e}")
+        return 1
+
+    before_objects = object_count(data)
+    counts = compact_strings(data)
+    after_text = json.dumps(data, ensure_ascii=False, indent=2, separators=(",", " : "))
+
+    before_bytes = len(before_text.encode("utf-8"))
+    after_bytes = len(after_text.encode("utf-8"))
+    before_parse = parse_seconds(before_text)
+    after_parse = parse_seconds(after_text)
+    after_objects = object_count(data)
+
+    print(f"📦 Compaction of {args.file}")
+    print(f"   - Removed {counts['en_anchors']} English anchors equal to their key")
+    print(
+        f"   - Removed {counts['identity_cells']} identity translations "
+        f"in {counts['identity_entries']} entries"
+    )
+    print(
+        f"   - Size: {before_bytes:,} → {after_bytes:,} bytes "
+        f"(-{before_bytes - after_bytes:,}, {100 * (before_bytes - after_bytes) / before_bytes:.1f}%)"
+    )
+    print(
+        f"   - Parse: {before_parse * 1000:.2f} → {after_parse * 1000:.2f} ms "
+        f"({(after_parse - before_parse) * 1000:+.2f} ms)"
+    )
+    print(f"   - JSON objects in memory: {before_objects:,} → {after_objects:,}")
+
+    if args.dry_run or after_text == before_text:
+        print("ℹ️ Catalog left unchanged")
+        return 0
+
+    save_strings(args.file, data)
+    print(f"✅ Compacted {args.file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""
+Differential check of the fast-path i18n engines against the reference ones.
+
+Generates randomized and edge-case catalogs (stale entries, shouldTranslate
+false, empty and whitespace values, `new` states, plural variations, regional
+variants, awkward keys) and runs every operation through the reference
+implementation in i18n_tools and through each optimized variant: the byte
+offset index, the fallback resolver, compaction and the vectorized length
+matrix. Reports per-variant speedups and exits 1 on any divergence. Runs
+fully offline.
+"""
+
+import argparse
+import copy
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from bisect import bisect_right
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from i18n_index import CatalogIndex
+from i18n_tools import (
+    DEFAULT_KEEP_LANGUAGES,
+    DEFAULT_LOCALE_PARENTS,
+    LocaleFallbacks,
+    compact_strings,
+    default_file_path,
+    expand_strings,
+    find_incomplete_translations,
+    find_untranslated,
+    load_strings,
+    prune_stale_strings,
+    save_strings,
+)
+
+try:
+    import i18n_expansion
+    from i18n_expansion import np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+BASE_LANGUAGES = ["en", "de", "es", "fr", "ja", "ko", "zh-Hans"]
+REGIONAL_LANGUAGES = ["zh-Hant", "zh-HK", "es-MX", "fr-CA", "pt-BR", "pt"]
+WORDS = [
+    "Save", "Subscription", "Abonnement endet in 2 Wochen", "%@", "%lld",
+    "%1$@ %2$@", "日本語", "구독", "订阅", "ß", "é", "\"quoted\"", "back\\slash",
+    "line\nbreak", "tab\t", "🙂", "https://example.com/icon.png", "", " ", "  ",
+]
+
+
+# MARK: - Catalog generation
+
+
+def random_text(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 3)))
+
+
+def random_cell(rng: random.Random, english: str) -> Dict[str, Any]:
+    roll = rng.random()
+    if roll < 0.45:
+        return {"stringUnit": {"state": "translated", "value": random_text(rng)}}
+    if roll < 0.6:
+        return {"stringUnit": {"state": "translated", "value": english}}
+    if roll < 0.68:
+        return {"stringUnit": {"state": "new", "value": rng.choice(["", english])}}
+    if roll < 0.72:
+        return {"stringUnit": {"state": "needs_review", "value": random_text(rng)}}
+    if roll < 0.8:
+        return {"stringUnit": {"state": "translated", "value": rng.choice(["", " ", "\n"])}}
+    if roll < 0.86:
+        return {"stringUnit": {"value": random_text(rng)}}
+    if roll < 0.93:
+        return {
+            "variations": {
+                "plural": {
+                    "one": {"stringUnit": {"state": "translated", "value": random_text(rng)}},
+                    "other": {"stringUnit": {"state": "translated", "value": random_text(rng)}},
+                }
+            }
+        }
+    return {}
+
+
+def random_entry(rng: random.Random, key: str, languages: List[str]) -> Dict[str, Any]:
+    entry: Dict[str, Any] = {}
+    if rng.random() < 0.1:
+        entry["comment"] = random_text(rng)
+    if rng.random() < 0.1:
+        entry["extractionState"] = rng.choice(["stale", "manual", "extracted_with_value"])
+    if rng.random() < 0.05:
+        return entry
+
+    english = key if rng.random() < 0.8 else random_text(rng)
+    identity = rng.random() < 0.08
+    locs: Dict[str, Any] = {}
+    for lang in languages:
+        if lang == "en":
+            roll = rng.random()
+            if roll < 0.75:
+                locs["en"] = {"stringUnit": {"state": "translated", "value": english}}
+            elif roll < 0.85:
+                locs["en"] = {"stringUnit": {"state": "new", "value": rng.choice(["", english])}}
+            continue
+        if identity:
+            locs[lang] = {"stringUnit": {"state": "translated", "value": english}}
+        elif rng.random() < 0.85:
+            locs[lang] = random_cell(rng, english)
+    entry["localizations"] = locs
+    if rng.random() < 0.06:
+        entry["shouldTranslate"] = False
+    return entry
+
+
+def generate_catalog(rng: random.Random, size: int) -> Dict[str, Any]:
+    languages = list(BASE_LANGUAGES)
+    if rng.random() < 0.5:
+        languages += rng.sample(REGIONAL_LANGUAGES, rng.randint(1, len(REGIONAL_LANGUAGES)))
+    strings: Dict[str, Any] = {}
+    while len(strings) < size:
+        key = random_text(rng) if rng.random() < 0.7 else f"Key {len(strings)} {random_text(rng)}"
+        strings.setdefault(key, random_entry(rng, key, languages))
+    return {"sourceLanguage": "en", "strings": strings, "version": "1.0"}
+
+
+def edge_case_catalogs() -> List[Tuple[str, Dict[str, Any]]]:
+    def catalog(strings: Dict[str, Any]) -> Dict[str, Any]:
+        return {"sourceLanguage": "en", "strings": strings, "version": "1.0"}
+
+    identity = {
+        lang: {"stringUnit": {"state": "translated", "value": "https://example.com/icon.png"}}
+        for lang in BASE_LANGUAGES
+    }
+    return [
+        ("empty", catalog({})),
+        ("bare key", catalog({"OK": {}})),
+        ("stale only", catalog({"Old": {"extractionState": "stale", "localizations": identity}})),
+        ("identity row", catalog({"https://example.com/icon.png": {"localizations": identity}})),
+        (
+            "awkward keys",
+            catalog(
+                {
+                    '"quoted" \\ key': {"localizations": {"en": {"stringUnit": {"state": "new", "value": ""}}}},
+                    "": {"shouldTranslate": False},
+                    "日本語 🙂\n": {"localizations": {"ja": {"stringUnit": {"state": "translated", "value": " "}}}},
+                }
+            ),
+        ),
+    ]
+
+
+# MARK: - Reference helpers
+
+
+def dumps(data: Dict[str, Any]) -> bytes:
+    return json.dumps(data, ensure_ascii=False, indent=2, separators=(",", " : ")).encode("utf-8")
+
+
+def check_findings(data: Dict[str, Any]) -> Tuple[Any, Any]:
+    """What check_translations and check_untranslated report for a catalog."""
+    data = copy.deepcopy(data)
+    expand_strings(data)
+    incomplete = find_incomplete_translations(data, clean_stale=True)
+    untranslated = find_untranslated(data, target_langs=DEFAULT_KEEP_LANGUAGES)
+    return incomplete[:2], untranslated
+
+
+def naive_chain(locale: str, parents: Dict[str, Optional[str]], source: str = "en") -> List[str]:
+    chain = [locale]
+    while True:
+        current = chain[-1]
+        if current in parents:
+            parent = parents[current]
+        else:
+            parent = current.rsplit("-", 1)[0] if "-" in current else None
+        if not parent or parent == source or parent in chain:
+            return chain
+        chain.append(parent)
+
+
+def naive_effective_findings(data: Dict[str, Any]) -> Tuple[Any, Any]:
+    """Effective coverage, walking each cell's fallback chain from scratch."""
+    data = copy.deepcopy(data)
+    prune_stale_strings(data)
+    translatable = {k: v for k, v in data["strings"].items() if v.get("shouldTranslate", True) is not False}
+    languages = sorted({lang for value in translatable.values() for lang in value.get("localizations", {})})
+
+    def unit(locs: Dict[str, Any], lang: str) -> Optional[Dict[str, Any]]:
+        return locs.get(lang, {}).get("stringUnit")
+
+    incomplete = []
+    for key, value in translatable.items():
+        locs = value.get("localizations", {})
+        for lang in languages:
+            covered = any(
+                (u := unit(locs, member)) and u.get("state") == "translated" and u.get("value", "").strip()
+                for member in naive_chain(lang, DEFAULT_LOCALE_PARENTS)
+            )
+            if covered:
+                continue
+            own = unit(locs, lang)
+            if not own:
+                incomplete.append((key, lang, "missing localization"))
+            elif own.get("state") != "translated":
+                incomplete.append((key, lang, f"state: {own.get('state')}"))
+            else:
+                incomplete.append((key, lang, "empty value"))
+
+    untranslated = []
+    for key, value in translatable.items():
+        locs = value.get("localizations", {})
+        missing = [
+            lang for lang in DEFAULT_KEEP_LANGUAGES
+            if not any(
+                (u := unit(locs, member)) and u.get("value", "").strip()
+                for member in naive_chain(lang, DEFAULT_LOCALE_PARENTS)
+            )
+        ]
+        if missing:
+            untranslated.append({"key": key, "missing": sorted(missing)})
+    return (languages, incomplete), untranslated
+
+
+def resolver_findings(data: Dict[str, Any]) -> Tuple[Any, Any]:
+    data = copy.deepcopy(data)
+    fallbacks = LocaleFallbacks()
+    incomplete = find_incomplete_translations(data, clean_stale=True, fallbacks=fallbacks)
+    untranslated = find_untranslated(data, target_langs=DEFAULT_KEEP_LANGUAGES, fallbacks=fallbacks)
+    return incomplete[:2], untranslated
+
+
+def naive_lengths(data: Dict[str, Any], display_width: bool) -> Any:
+    """Per-string Python loop over the same inputs load_lengths vectorizes."""
+    entries = {
+        key: value.get("localizations", {})
+        for key, value in data["strings"].items()
+        if value.get("shouldTranslate", True) is not False and value.get("extractionState") != "stale"
+    }
+    others = {lang for locs in entries.values() for lang in locs} - {"en"}
+    columns = {lang: index for index, lang in enumerate(["en"] + sorted(others))}
+    starts = [low for low, _ in i18n_expansion.WIDE_RANGES]
+
+    expected = np.full((len(entries), len(columns)), np.nan)
+    for row, (key, locs) in enumerate(entries.items()):
+        for lang, cell in locs.items():
+            value = cell.get("stringUnit", {}).get("value", "")
+            if not value.strip():
+                continue
+            width = 0
+            for char in value:
+                slot = bisect_right(starts, ord(char)) - 1
+                wide = display_width and slot >= 0 and ord(char) <= i18n_expansion.WIDE_RANGES[slot][1]
+                width += 2 if wide else 1
+            expected[row, columns[lang]] = width
+        if np.isnan(expected[row, 0]):
+            expected[row, 0] = len(key)
+    return list(entries), expected
+
+
+# MARK: - Harness
+
+
+class Results:
+    def __init__(self) -> None:
+        self.rows: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def record(
+        self,
+        operation: str,
+        variant: str,
+        case: str,
+        reference: Callable[[], Any],
+        optimized: Callable[[], Any],
+        equal: Callable[[Any, Any], bool] = lambda a, b: a == b,
+    ) -> None:
+        row = self.rows.setdefault(
+            (operation, variant),
+            {"reference": 0.0, "variant": 0.0, "runs": 0, "divergences": []},
+        )
+        start = time.perf_counter()
+        expected = reference()
+        middle = time.perf_counter()
+        actual = optimized()
+        end = time.perf_counter()
+        row["reference"] += middle - start
+        row["variant"] += end - middle
+        row["runs"] += 1
+        if not equal(expected, actual):
+            row["divergences"].append(case)
+
+    def print_report(self) -> int:
+        print(f"{'operation':<10} {'variant':<22} {'runs':>5} {'reference':>11} {'variant':>11} {'speedup':>8}  result")
+        diverged = 0
+        for (operation, variant), row in self.rows.items():
+            speedup = row["reference"] / row["variant"] if row["variant"] else float("inf")
+            status = "ok"
+            if row["divergences"]:
+                diverged += 1
+                status = f"DIVERGED in {len(row['divergences'])}: {', '.join(row['divergences'][:3])}"
+            print(
+                f"{operation:<10} {variant:<22} {row['runs']:>5} "
+                f"{row['reference'] * 1000:>9.1f}ms {row['variant'] * 1000:>9.1f}ms "
+                f"{speedup:>7.2f}x  {status}"
+            )
+        return diverged
+
+
+def run_case(results: Results, rng: random.Random, case: str, data: Dict[str, Any], workdir: str) -> None:
+    catalog_path = os.path.join(workdir, "Localizable.xcstrings")
+    save_strings(catalog_path, data)
+    keys = list(data["strings"])
+    sample = rng.sample(keys, min(len(keys), 10))
+
+    # Single-key reads: full parse per lookup vs the byte-offset index.
+    CatalogIndex(catalog_path).refresh()
+    results.record(
+        "lookup", "index", case,
+        lambda: [load_strings(catalog_path)["strings"][key] for key in sample],
+        lambda: [CatalogIndex(catalog_path).get(key) for key in sample],
+    )
+
+    # Single-cell edits: load + save_strings vs in-place span replacement.
+    if keys:
+        key, lang = rng.choice(keys), rng.choice(BASE_LANGUAGES + REGIONAL_LANGUAGES)
+        value = random_text(rng)
+        edited_path = os.path.join(workdir, "Edited.xcstrings")
+        shutil.copy(catalog_path, edited_path)
+        CatalogIndex(edited_path).refresh()
+
+        def reference_edit() -> bytes:
+            edited = load_strings(catalog_path)
+            edited["strings"][key].setdefault("localizations", {})[lang] = {
+                "stringUnit": {"state": "translated", "value": value}
+            }
+            return dumps(edited)
+
+        def index_edit() -> bytes:
+            CatalogIndex(edited_path).set_value(key, lang, value)
+            with open(edited_path, "rb") as f:
+                return f.read()
+
+        results.record("edit", "index", case, reference_edit, index_edit)
+
+    # Index maintenance: full rebuild vs incremental refresh after an external edit.
+    mutated = copy.deepcopy(data)
+    if keys:
+        victim = rng.choice(keys)
+        if rng.random() < 0.5:
+            del mutated["strings"][victim]
+        else:
+            mutated["strings"][victim]["comment"] = random_text(rng)
+    mutated["strings"][f"Added {rng.random()}"] = {}
+    index = CatalogIndex(catalog_path)
+    save_strings(catalog_path, mutated)
+    rebuilt_index = os.path.join(workdir, "rebuilt.index")
+    if os.path.exists(rebuilt_index):
+        os.remove(rebuilt_index)
+    def full_rebuild() -> List[list]:
+        rebuilt = CatalogIndex(catalog_path, index_path=rebuilt_index)
+        rebuilt.refresh()
+        return rebuilt.entries
+
+    def incremental_refresh() -> List[list]:
+        index.refresh()
+        return index.entries
+
+    results.record("reindex", "incremental", case, full_rebuild, incremental_refresh)
+
+    # Findings: the check pipeline on the original vs the compacted catalog,
+    # and chain walking per cell vs the memoized fallback resolver. Entries are
+    # anchored first, as `i18n update` leaves them, so compaction always has
+    # English cells to drop rather than comparing a no-op.
+    anchored = copy.deepcopy(data)
+    for key, value in anchored["strings"].items():
+        value.setdefault("localizations", {}).setdefault(
+            "en", {"stringUnit": {"state": "translated", "value": key}}
+        )
+    results.record(
+        "findings", "compacted (anchored)", case,
+        lambda: check_findings(anchored),
+        lambda: check_findings((lambda d: (compact_strings(d), d)[1])(copy.deepcopy(anchored))),
+    )
+    results.record("findings", "fallback resolver", case, lambda: naive_effective_findings(data), lambda: resolver_findings(data))
+
+    if np is not None:
+        def same_matrix(expected: Any, actual: Any) -> bool:
+            return expected[0] == actual[0] and np.array_equal(expected[1], actual[1], equal_nan=True)
+
+        for display_width in (False, True):
+            results.record(
+                "lengths", f"numpy (width={display_width})", case,
+                lambda: naive_lengths(data, display_width),
+                lambda: (lambda m: (m.keys, m.lengths))(
+                    i18n_expansion.load_lengths(data, display_width=display_width)
+                ),
+                same_matrix,
+            )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("-n", "--iterations", type=int, default=25, help="random catalogs")
+    parser.add_argument("--max-keys", type=int, default=300)
+    parser.add_argument("--no-repo", action="store_true", help="skip the repository catalog")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    cases = edge_case_catalogs()
+    cases += [
+        (f"random #{index}", generate_catalog(rng, rng.randint(1, args.max_keys)))
+        for index in range(args.iterations)
+    ]
+    if not args.no_repo and os.path.isfile(default_file_path()):
+        cases.append(("repository", load_strings(default_file_path())))
+
+    results = Results()
+    with tempfile.TemporaryDirectory() as workdir:
+        for case, data in cases:
+            case_dir = os.path.join(workdir, str(len(os.listdir(workdir))))
+            os.mkdir(case_dir)
+            run_case(results, rng, case, data, case_dir)
+
+    print(f"🔬 {len(cases)} catalogs (seed {args.seed})\n")
+    diverged = results.print_report()
+    if np is None:
+        print("\nℹ️ numpy not installed; skipped vectorized length checks")
+    print()
+    if diverged:
+        print(f"❌ {diverged} variants diverged from the reference implementation")
+        return 1
+    print("✅ All variants match the reference implementation")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Flag translations that run much longer than English and risk truncation.
+
+All (key, language) value lengths are loaded into one NumPy matrix in a single
+pass over the catalog; expansion ratios, per-language z-scores and percentile
+outliers are then computed for the whole catalog in one batched step.
+Requires numpy (`pip3 install numpy`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import warnings
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - reported by main()
+    np = None
+
+from i18n_tools import default_file_path, load_strings, should_translate
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Iterable
+
+# Code point ranges rendered two columns wide (East Asian Wide/Fullwidth).
+# This covers CJK, kana, Hangul, fullwidth forms and common emoji blocks.
+WIDE_RANGES = (
+    (0x1100, 0x115F),
+    (0x2E80, 0x303E),
+    (0x3041, 0x33FF),
+    (0x3400, 0x4DBF),
+    (0x4E00, 0x9FFF),
+    (0xA000, 0xA4CF),
+    (0xAC00, 0xD7A3),
+    (0xF900, 0xFAFF),
+    (0xFE30, 0xFE4F),
+    (0xFF00, 0xFF60),
+    (0xFFE0, 0xFFE6),
+    (0x1F300, 0x1F64F),
+    (0x1F900, 0x1F9FF),
+    (0x20000, 0x2FFFD),
+    (0x30000, 0x3FFFD),
+)
+
+
+class LengthMatrix:
+    """Value lengths for every (key, language) cell; NaN where a cell is missing."""
+
+    def __init__(self, keys: list[str], languages: list[str], lengths: Any) -> None:
+        self.keys = keys
+        self.languages = languages
+        self.lengths = lengths
+
+
+def load_lengths(
+    data: dict[str, Any],
+    languages: Iterable[str] | None = None,
+    display_width: bool = False,
+) -> LengthMatrix:
+    """
+    Collect value lengths in one pass over the catalog.
+    With `display_width`, wide (CJK) characters count as two columns.
+    """
+    source = data.get("sourceLanguage", "en")
+    strings = data["strings"]
+    entries = [
+        (key, value.get("localizations", {}))
+        for key, value in strings.items()
+        if should_translate(value) and value.get("extractionState") != "stale"
+    ]
+    if languages is None:
+        languages = {lang for _, locs in entries for lang in locs}
+    languages = [source] + sorted(set(languages) - {source})
+    columns = {lang: index for index, lang in enumerate(languages)}
+
+    keys: list[str] = []
+    texts: list[str] = []
+    rows: list[int] = []
+    cols: list[int] = []
+    for row, (key, locs) in enumerate(entries):
+        keys.append(key)
+        for lang, cell in locs.items():
+            column = columns.get(lang)
+            value = cell.get("stringUnit", {}).get("value", "")
+            if column is None or not value.strip():
+                continue
+            texts.append(value)
+            rows.append(row)
+            cols.append(column)
+
+    # Concatenate every value once and measure segments with a prefix sum,
+    # so per-string widths need no Python loop over characters.
+    codepoints = np.frombuffer("".join(texts).encode("utf-32-le"), dtype=np.uint32)
+    if display_width:
+        bounds = np.array(WIDE_RANGES, dtype=np.uint32)
+        slot = np.searchsorted(bounds[:, 0], codepoints, side="right") - 1
+        wide = (slot >= 0) & (codepoints <= bounds[np.maximum(slot, 0), 1])
+        weights = 1 + wide.astype(np.int64)
+    else:
+        weights = np.ones(codepoints.shape, dtype=np.int64)
+    prefix = np.concatenate(([0], np.cumsum(weights)))
+    sizes = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+    ends = np.cumsum(sizes)
+    starts = ends - sizes
+
+    lengths = np.full((len(keys), len(languages)), np.nan)
+    lengths[np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64)] = prefix[ends] - prefix[starts]
+
+    # Fall back to the key for missing source values, matching the runtime.
+    missing_source = np.isnan(lengths[:, 0])
+    if missing_source.any():
+        key_lengths = np.fromiter(map(len, keys), dtype=np.float64, count=len(keys))
+        lengths[missing_source, 0] = key_lengths[missing_source]
+
+    return LengthMatrix(keys, languages, lengths)
+
+
+def score_expansion(
+    matrix: LengthMatrix,
+    percentile: float = 95.0,
+    z_threshold: float = 2.0,
+    min_length: int = 4,
+) -> dict[str, Any]:
+    """
+    Compute expansion ratios against the source language for every cell.
+
+    A cell longer than its source is flagged when its ratio exceeds the
+    language's `percentile` or its z-score reaches `z_threshold`. Source strings shorter than
+    `min_length` are ignored since their ratios are mostly noise.
+    """
+    lengths = matrix.lengths
+    source = lengths[:, :1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = lengths[:, 1:] / source
+    ratios[(source < min_length).ravel(), :] = np.nan
+
+    # Languages without comparable cells produce all-NaN columns; keep quiet.
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        mean = np.nanmean(ratios, axis=0)
+        std = np.nanstd(ratios, axis=0)
+        median = np.nanmedian(ratios, axis=0)
+        cutoff = np.nanpercentile(ratios, percentile, axis=0)
+        z_scores = (ratios - mean) / np.where(std > 0, std, np.nan)
+        flagged = (ratios > cutoff) | (z_scores >= z_threshold)
+    # Only translations longer than the source can truncate.
+    flagged &= ratios > 1.0
+
+    return {
+        "languages": matrix.languages[1:],
+        "ratios": ratios,
+        "z_scores": z_scores,
+        "median": median,
+        "cutoff": cutoff,
+        "flagged": flagged,
+    }
+
+
+def main(argv: list[str] | None = None, prog: str | None = None) -> int:
+    parser = argparse.ArgumentParser(prog=prog, description=__doc__.strip().splitlines()[0])
+    parser.add_argument("file", nargs="?", default=default_file_path())
+    parser.add_argument("--percentile", type=float, default=95.0)
+    parser.add_argument("--z", type=float, default=2.0, dest="z_threshold")
+    parser.add_argument("--min-length", type=int, default=4)
+    parser.add_argument(
+        "--display-width",
+        action="store_true",
+        help="count wide CJK characters as two columns",
+    )
+    parser.add_argument("--top", type=int, default=20, help="flagged cells to list")
+    args = parser.parse_args(argv)
+
+    if np is None:
+        print("❌ numpy is required for expansion analysis: pip3 install numpy")
+        return 1
+
+    data = load_strings(args.file)
+    matrix = load_lengths(data, display_width=args.display_width)
+    scores = score_expansion(
+        matrix,
+        percentile=args.percentile,
+        z_threshold=args.z_threshold,
+        min_length=args.min_length,
+    )
+    languages = scores["languages"]
+    flagged = scores["flagged"]
+
+    unit = "display width" if args.display_width else "characters"
+    print(f"📏 Expansion vs {matrix.languages[0]} ({unit}) in {args.file}\n")
+    print(f"  {'lang':<8} {'median':>7} {'p' + format(args.percentile, 'g'):>7} {'flagged':>8}")
+    for index, lang in enumerate(languages):
+        print(
+            f"  {lang:<8} {scores['median'][index]:>7.2f} "
+            f"{scores['cutoff'][index]:>7.2f} {int(flagged[:, index].sum()):>8}"
+        )
+
+    rows, cols = np.nonzero(flagged)
+    if not len(rows):
+        print("\n✅ No truncation-risk translations found.")
+        return 0
+
+    order = np.argsort(-scores["ratios"][rows, cols], kind="stable")[: args.top]
+    strings = data["strings"]
+    print(f"\n⚠️ {len(rows)} truncation-risk translations (top {len(order)}):")
+    for index in order:
+        row, col = rows[index], cols[index]
+        key, lang = matrix.keys[row], languages[col]
+        value = strings[key]["localizations"][lang]["stringUnit"]["value"]
+        print(
+            f"  {scores['ratios'][row, col]:.2f}x (z={scores['z_scores'][row, col]:.1f}) "
+            f"{lang}: {key!r} → {value!r}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Report per-language translation coverage across the git history of the catalog.
+
+Every revision of Localizable.xcstrings is identified by its git blob hash.
+Analysis results are memoized on disk under that hash, so each distinct
+version of the file is parsed once, ever, no matter how many commits share it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from i18n_tools import (
+    default_file_path,
+    expand_strings,
+    find_incomplete_translations,
+    should_translate,
+)
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+# Bump when the analysis below changes so stale memo entries are recomputed.
+MEMO_VERSION = 4
+MEMO_FILE_NAME = "subzen-i18n-history.json"
+
+NULL_BLOB = "0" * 40
+
+
+def git(args: list[str], cwd: str) -> str:
+    """Run a git command and return its stdout."""
+    result = subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout
+
+
+def locate_catalog(file_path: str) -> tuple[str, str]:
+    """Return (repository root, catalog path relative to that root)."""
+    directory = os.path.dirname(os.path.abspath(file_path))
+    root = git(["rev-parse", "--show-toplevel"], directory).strip()
+    relative = os.path.relpath(os.path.realpath(file_path), os.path.realpath(root))
+    return root, relative.replace(os.sep, "/")
+
+
+def default_memo_path(repo_root: str) -> str:
+    """Keep the memo inside the git directory so it is never committed."""
+    git_dir = git(["rev-parse", "--git-common-dir"], repo_root).strip()
+    return os.path.join(repo_root, git_dir, MEMO_FILE_NAME)
+
+
+def list_revisions(
+    repo_root: str,
+    relative_path: str,
+    max_count: int | None = None,
+) -> list[dict[str, str]]:
+    """
+    Walk `git log` for the catalog, newest first.
+    Returns [{"commit", "date", "blob"}] for commits that touched the file.
+    """
+    args = ["log", "--format=>%H%x09%as", "--raw", "--no-abbrev", "--no-renames"]
+    if max_count:
+        args.append(f"--max-count={max_count}")
+    args += ["--", relative_path]
+
+    revisions: list[dict[str, str]] = []
+    current: dict[str, str] | None = None
+    for line in git(args, repo_root).splitlines():
+        if line.startswith(">"):
+            commit, date = line[1:].split("\t", 1)
+            current = {"commit": commit, "date": date}
+        elif line.startswith(":") and current is not None:
+            # :<old mode> <new mode> <old blob> <new blob> <status>\t<path>
+            blob = line.split("\t", 1)[0].split()[3]
+            if blob != NULL_BLOB:
+                revisions.append({**current, "blob": blob})
+            current = None
+    return revisions
+
+
+def read_blobs(repo_root: str, blobs: list[str]) -> dict[str, bytes]:
+    """Fetch blob contents through a single `git cat-file --batch` process."""
+    if not blobs:
+        return {}
+    process = subprocess.run(
+        ["git", "cat-file", "--batch"],
+        cwd=repo_root,
+        input="\n".join(blobs).encode() + b"\n",
+        check=True,
+        capture_output=True,
+    )
+    output = process.stdout
+    contents: dict[str, bytes] = {}
+    offset = 0
+    for blob in blobs:
+        header_end = output.index(b"\n", offset)
+        header = output[offset:header_end].split()
+        size = int(header[2])
+        start = header_end + 1
+        contents[blob] = output[start : start + size]
+        offset = start + size + 1
+    return contents
+
+
+def analyze_catalog(raw: bytes) -> dict[str, Any]:
+    """Return translatable totals and per-language translated counts."""
+    try:
+        data = json.loads(raw.decode("utf-8"))
+        expand_strings(data)
+        languages, incomplete, _ = find_incomplete_translations(data, clean_stale=True)
+        total = sum(1 for value in data["strings"].values() if should_translate(value))
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        return {"error": str(e)}
+    except (KeyError, TypeError, AttributeError) as e:
+        # Valid JSON, but not shaped like a string catalog.
+        return {"error": f"unexpected catalog layout ({type(e).__name__}: {e})"}
+
+    missing: dict[str, int] = {lang: 0 for lang in languages}
+    for _, lang, _ in incomplete:
+        missing[lang] += 1
+    return {
+        "total": total,
+        "translated": {lang: total - missing[lang] for lang in languages},
+    }
+
+
+def load_memo(memo_path: str) -> dict[str, Any]:
+    try:
+        with open(memo_path, "r", encoding="utf-8") as f:
+            memo = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if memo.get("version") != MEMO_VERSION:
+        return {}
+    return memo.get("blobs", {})
+
+
+def save_memo(memo_path: str, blobs: dict[str, Any]) -> None:
+    temp_path = f"{memo_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": MEMO_VERSION, "blobs": blobs}, f, ensure_ascii=False)
+    os.replace(temp_path, memo_path)
+
+
+def analyze_revisions(
+    repo_root: str,
+    revisions: list[dict[str, str]],
+    memo: dict[str, Any],
+    jobs: int | None = None,
+) -> int:
+    """
+    Fill `memo` with results for every blob referenced by `revisions`.
+    Only blobs missing from the memo are read and parsed, on a worker pool.
+    Returns the number of newly analyzed blobs.
+    """
+    pending = sorted({rev["blob"] for rev in revisions} - memo.keys())
+    if not pending:
+        return 0
+
+    contents = read_blobs(repo_root, pending)
+    jobs = jobs or None
+    if jobs == 1 or len(pending) == 1:
+        results = map(analyze_catalog, (contents[blob] for blob in pending))
+        memo.update(zip(pending, results))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = pool.map(analyze_catalog, (contents[blob] for blob in pending))
+            memo.update(zip(pending, results))
+    return len(pending)
+
+
+def format_table(revisions: list[dict[str, str]], memo: dict[str, Any]) -> list[str]:
+    """Render one row per commit with coverage percentages per language."""
+    languages = sorted(
+        {
+            lang
+            for rev in revisions
+            for lang in memo[rev["blob"]].get("translated", {})
+        }
+    )
+    widths = [max(len(lang), 6) for lang in languages]
+    header = ["commit ", "date      ", " total"] + [
+        lang.rjust(width) for lang, width in zip(languages, widths)
+    ]
+    lines = ["  ".join(header)]
+
+    for rev in revisions:
+        result = memo[rev["blob"]]
+        row = [rev["commit"][:7], rev["date"]]
+        if "error" in result:
+            lines.append("  ".join(row + [f"parse error: {result['error']}"]))
+            continue
+
+        total = result["total"]
+        row.append(str(total).rjust(6))
+        for lang, width in zip(languages, widths):
+            translated = result["translated"].get(lang)
+            if translated is None or not total:
+                cell = "-"
+            else:
+                cell = f"{translated * 100 / total:.1f}%"
+            row.append(cell.rjust(width))
+        lines.append("  ".join(row))
+    return lines
+
+
+def job_count(text: str) -> int:
+    """argparse type for -j/--jobs: a worker count, where 0 means one per CPU."""
+    try:
+        jobs = int(text)
+    except ValueError:
+        jobs = -1
+    if jobs < 0:
+        raise argparse.ArgumentTypeError(f"expected a non-negative integer, got '{text}'")
+    return jobs
+
+
+def main(argv: list[str] | None = None, prog: str | None = None) -> int:
+    parser = argparse.ArgumentParser(prog=prog, description=__doc__.strip().splitlines()[0])
+    parser.add_argument("file", nargs="?", default=default_file_path())
+    parser.add_argument("-n", "--max-count", type=int, help="limit number of commits")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=job_count,
+        help="worker processes (default or 0: one per CPU)",
+    )
+    parser.add_argument("--memo", help=f"memo file (default: .git/{MEMO_FILE_NAME})")
+    args = parser.parse_args(argv)
+
+    if not os.path.isfile(args.file):
+        print(f"❌ File not found: {args.file}")
+        return 1
+    try:
+        repo_root, relative_path = locate_catalog(args.file)
+    except subprocess.CalledProcessError:
+        print(f"❌ Not inside a git repository: {args.file}")
+        return 1
+
+    revisions = list_revisions(repo_root, relative_path, args.max_count)
+    if not revisions:
+        print(f"ℹ️ No history found for {relative_path}")
+        return 0
+
+    memo_path = args.memo or default_memo_path(repo_root)
+    memo = load_memo(memo_path)
+    analyzed = analyze_revisions(repo_root, revisions, memo, jobs=args.jobs)
+    if analyzed:
+        save_memo(memo_path, memo)
+
+    for line in format_table(revisions, memo):
+        print(line)
+    print()
+    print(
+        f"{len(revisions)} commits, {len({rev['blob'] for rev in revisions})} distinct "
+        f"versions, {analyzed} newly analyzed (memo: {memo_path})"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Random-access reads and edits of single keys in Localizable.xcstrings.
+
+A sidecar index (<catalog>.index) maps every key to the byte span of its
+entry in the canonical formatting written by save_strings (and Xcode).
+Lookups slice the entry out of an mmap and parse only that; edits rewrite
+only that span. When the catalog changes behind the index's back, entries
+whose bytes still match are kept and only the changed region is rescanned.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+import os
+import sys
+import zlib
+from json.decoder import scanstring
+
+from i18n_tools import default_file_path
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+INDEX_VERSION = 1
+STRINGS_HEADER = b'\n  "strings" : {\n'
+ENTRY_PREFIX = b'    "'
+STRINGS_FOOTER = b"  }"
+EMPTY_STRINGS = b'\n  "strings" : {}'
+
+
+def encode_entry(key: str, entry: dict[str, Any]) -> bytes:
+    """Serialize one entry exactly as save_strings lays it out in the file."""
+    text = json.dumps(
+        {key: entry},
+        ensure_ascii=False,
+        indent=2,
+        separators=(",", " : "),
+    )
+    lines = text.split("\n")[1:-1]
+    return "\n".join("  " + line for line in lines).encode("utf-8")
+
+
+def scan_entries(buffer, start: int, stop: int | None = None) -> tuple[list[list], int]:
+    """
+    Scan entry lines from `start` (the beginning of an entry line) up to `stop`,
+    or up to the closing brace of the strings object when `stop` is None.
+    Returns ([key, start, end, crc32] spans, offset where scanning stopped).
+    """
+    entries: list[list] = []
+    position = start
+    limit = len(buffer) if stop is None else stop
+
+    def close(end: int) -> None:
+        # Drop the trailing ",\n" / "\n" separating this entry from the next.
+        while end > entries[-1][1] and buffer[end - 1 : end] in (b"\n", b","):
+            end -= 1
+        entries[-1][2] = end
+        entries[-1][3] = zlib.crc32(buffer[entries[-1][1] : end])
+
+    while position < limit:
+        line_end = buffer.find(b"\n", position, limit)
+        line_end = limit if line_end == -1 else line_end + 1
+        if buffer[position : position + len(ENTRY_PREFIX)] == ENTRY_PREFIX:
+            if entries:
+                close(position)
+            line = buffer[position:line_end].decode("utf-8")
+            key, _ = scanstring(line, len(ENTRY_PREFIX))
+            entries.append([key, position, line_end, 0])
+        elif stop is None and buffer[position : position + len(STRINGS_FOOTER) + 1] in (
+            STRINGS_FOOTER + b"\n",
+            STRINGS_FOOTER + b",",
+        ):
+            limit = position
+            break
+        elif not entries:
+            raise ValueError("catalog is not in canonical xcstrings formatting")
+        position = line_end
+
+    if entries:
+        close(limit)
+    return entries, limit
+
+
+class CatalogIndex:
+    """Byte-span index over the `strings` entries of an xcstrings catalog."""
+
+    def __init__(self, file_path: str, index_path: str | None = None) -> None:
+        self.file_path = file_path
+        self.index_path = index_path or f"{file_path}.index"
+        self.entries: list[list] = []
+        self.spans: dict[str, list] = {}
+        self.size = -1
+        self.mtime_ns = -1
+        self.rescanned = 0
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return
+        if index.get("version") != INDEX_VERSION:
+            return
+        self.entries = index["entries"]
+        self.size = index["size"]
+        self.mtime_ns = index["mtime_ns"]
+        self.spans = {entry[0]: entry for entry in self.entries}
+
+    def _save(self) -> None:
+        stat = os.stat(self.file_path)
+        self.size, self.mtime_ns = stat.st_size, stat.st_mtime_ns
+        temp_path = f"{self.index_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": INDEX_VERSION,
+                    "size": self.size,
+                    "mtime_ns": self.mtime_ns,
+                    "entries": self.entries,
+                },
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(temp_path, self.index_path)
+
+    def is_stale(self) -> bool:
+        stat = os.stat(self.file_path)
+        return (stat.st_size, stat.st_mtime_ns) != (self.size, self.mtime_ns)
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        Bring the index up to date with the catalog.
+
+        Leading entries whose bytes are unchanged are kept in place, trailing
+        ones are kept with their offsets shifted, and only the region between
+        them is rescanned. Unless `force` is set, nothing is checked while the
+        catalog's size and mtime match the index. Returns the number of
+        entries rescanned.
+        """
+        if not force and self.size >= 0 and not self.is_stale():
+            return 0
+
+        with open(self.file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            old = self.entries
+            delta = len(buffer) - self.size
+
+            def matches(entry: list, shift: int = 0) -> bool:
+                start, end = entry[1] + shift, entry[2] + shift
+                return 0 <= start and end <= len(buffer) and zlib.crc32(buffer[start:end]) == entry[3]
+
+            head = 0
+            while head < len(old) and matches(old[head]):
+                head += 1
+            tail = len(old)
+            while tail > head and matches(old[tail - 1], delta):
+                tail -= 1
+
+            if head:
+                # Resume at the line after the last unchanged entry.
+                start = buffer.find(b"\n", old[head - 1][2]) + 1
+            else:
+                header = buffer.find(STRINGS_HEADER)
+                if header != -1:
+                    start = header + len(STRINGS_HEADER)
+                elif buffer.find(EMPTY_STRINGS) != -1:
+                    start = len(buffer)
+                else:
+                    raise ValueError(f"{self.file_path} is not in canonical xcstrings formatting")
+
+            if tail < len(old):
+                middle, _ = scan_entries(buffer, start, old[tail][1] + delta)
+                suffix = [[key, s + delta, e + delta, crc] for key, s, e, crc in old[tail:]]
+            else:
+                middle, _ = scan_entries(buffer, start)
+                suffix = []
+
+        self.entries = old[:head] + middle + suffix
+        self.spans = {entry[0]: entry for entry in self.entries}
+        self.rescanned = len(middle)
+        self._save()
+        return self.rescanned
+
+    def keys(self) -> list[str]:
+        self.refresh()
+        return [entry[0] for entry in self.entries]
+
+    def _read_span(self, key: str) -> tuple[list, bytes]:
+        """
+        Return the span of `key` and its bytes, verified against the stored
+        CRC. An edit that keeps the size and mtime slips past is_stale, so a
+        mismatch forces a rescan before the span is trusted.
+        """
+        self.refresh()
+        for _ in range(2):
+            span = self.spans[key]
+            with open(self.file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                raw = buffer[span[1] : span[2]]
+            if zlib.crc32(raw) == span[3]:
+                return span, raw
+            self.refresh(force=True)
+        raise ValueError(f"{self.index_path} does not match {self.file_path}")
+
+    def get(self, key: str) -> dict[str, Any]:
+        """Parse and return a single entry without loading the whole catalog."""
+        _, raw = self._read_span(key)
+        return json.loads(b"{" + raw + b"}")[key]
+
+    def set(self, key: str, entry: dict[str, Any]) -> None:
+        """Replace one existing entry in place, shifting later spans if its size changes."""
+        span, _ = self._read_span(key)
+        _, start, end, _ = span
+        payload = encode_entry(key, entry)
+        delta = len(payload) - (end - start)
+
+        if delta == 0:
+            with open(self.file_path, "r+b") as f, mmap.mmap(f.fileno(), 0) as buffer:
+                buffer[start:end] = payload
+                buffer.flush()
+        else:
+            # mmap cannot grow or shrink portably (no mremap on macOS),
+            # so rewrite from the entry onward through the file object.
+            with open(self.file_path, "r+b") as f:
+                f.seek(end)
+                tail = f.read()
+                f.seek(start)
+                f.write(payload)
+                f.write(tail)
+                f.truncate()
+
+        span[2] = start + len(payload)
+        span[3] = zlib.crc32(payload)
+        if delta:
+            position = self.entries.index(span)
+            for later in self.entries[position + 1 :]:
+                later[1] += delta
+                later[2] += delta
+        self._save()
+
+    def set_value(self, key: str, language: str, value: str, state: str = "translated") -> None:
+        entry = self.get(key)
+        locs = entry.setdefault("localizations", {})
+        locs[language] = {
+            "stringUnit": {
+                "state": state,
+                "value": value,
+            }
+        }
+        self.set(key, entry)
+
+
+def main(argv=None, prog=None) -> int:
+    parser = argparse.ArgumentParser(prog=prog, description=__doc__.strip().splitlines()[0])
+    actions = parser.add_subparsers(dest="action", required=True)
+    get = actions.add_parser("get", help="print one entry, or one language's value")
+    get.add_argument("key")
+    get.add_argument("file", nargs="?", default=default_file_path())
+    get.add_argument("-l", "--language", help="print only this language's value")
+    put = actions.add_parser("set", help="set one language's value for a key")
+    put.add_argument("key")
+    put.add_argument("language")
+    put.add_argument("value")
+    put.add_argument("file", nargs="?", default=default_file_path())
+    rebuild = actions.add_parser("rebuild", help="refresh the sidecar index")
+    rebuild.add_argument("file", nargs="?", default=default_file_path())
+    args = parser.parse_args(argv)
+
+    if not os.path.isfile(args.file):
+        print(f"❌ File not found: {args.file}")
+        return 1
+    try:
+        index = CatalogIndex(args.file)
+        if args.action == "rebuild":
+            rescanned = index.refresh()
+            print(f"✅ Indexed {len(index.entries)} keys ({rescanned} rescanned) in {index.index_path}")
+            return 0
+
+        if args.key not in index.keys():
+            print(f"❌ Key not found: {args.key}")
+            return 1
+        if args.action == "get":
+            entry = index.get(args.key)
+            if args.language:
+                unit = entry.get("localizations", {}).get(args.language, {}).get("stringUnit")
+                if not unit:
+                    print(f"❌ No {args.language} value for: {args.key}")
+                    return 1
+                print(unit.get("value", ""))
+            else:
+                print(json.dumps(entry, ensure_ascii=False, indent=2, separators=(",", " : ")))
+            return 0
+
+        index.set_value(args.key, args.language, args.value)
+        print(f"✅ Set {args.language} value for {args.key!r} in {args.file}")
+        return 0
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
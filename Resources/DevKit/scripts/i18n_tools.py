@@ -6,30 +6,58 @@ These utilities keep the behavior between our translation scripts consistent
 and remove duplication across per-locale entrypoints.
 """
 
+from __future__ import annotations
+
 import json
 import os
 import sys
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Annotations are never evaluated at runtime, so skip importing typing:
+# these helpers run on every pre-commit hook and startup time adds up.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Callable, Iterable
 
 # Languages we keep without auto-filling from English
 DEFAULT_KEEP_LANGUAGES = {"ja", "de", "fr", "es", "ko", "zh-Hans"}
 
+# Regional variants and the locale they inherit missing values from; None ends
+# the chain. Other locales fall back by dropping their last subtag (de-AT → de).
+# The Chinese scripts never fall back to each other, nor to a bare "zh".
+DEFAULT_LOCALE_PARENTS: dict[str, str | None] = {
+    "zh-HK": "zh-Hant",
+    "zh-Hant": None,
+    "zh-Hans": None,
+    "es-MX": "es",
+    "fr-CA": "fr",
+    "pt-BR": "pt",
+}
+
+
+CATALOG_PATH = os.path.join("SubZen", "Resources", "Localizable.xcstrings")
+
 
 def default_file_path() -> str:
     """Return the absolute path to SubZen/Resources/Localizable.xcstrings."""
-    return os.path.abspath(
-        os.path.join(
-            os.path.dirname(__file__),
-            "..",
-            "..",
-            "SubZen",
-            "Resources",
-            "Localizable.xcstrings",
+    if os.path.isfile(__file__):
+        return os.path.abspath(
+            os.path.join(os.path.dirname(__file__), "..", "..", "..", CATALOG_PATH)
         )
-    )
 
+    # Running from a zipapp: the scripts are not inside the repository,
+    # so look for the catalog from the working directory upward.
+    directory = os.getcwd()
+    while True:
+        candidate = os.path.join(directory, CATALOG_PATH)
+        if os.path.isfile(candidate):
+            return candidate
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return os.path.join(os.getcwd(), CATALOG_PATH)
+        directory = parent
 
-def load_strings(file_path: str) -> Dict[str, Any]:
+
+def load_strings(file_path: str) -> dict[str, Any]:
     """Load the xcstrings JSON with helpful error messages."""
     try:
         with open(file_path, "r", encoding="utf-8") as f:
@@ -42,7 +70,7 @@ def load_strings(file_path: str) -> Dict[str, Any]:
         sys.exit(1)
 
 
-def save_strings(file_path: str, data: Dict[str, Any]) -> None:
+def save_strings(file_path: str, data: dict[str, Any]) -> None:
     """Persist the xcstrings JSON."""
     with open(file_path, "w", encoding="utf-8") as f:
         json.dump(
@@ -54,12 +82,12 @@ def save_strings(file_path: str, data: Dict[str, Any]) -> None:
         )
 
 
-def should_translate(entry: Dict[str, Any]) -> bool:
+def should_translate(entry: dict[str, Any]) -> bool:
     """Return whether this entry should be translated based on JSON flag."""
     return entry.get("shouldTranslate", True) is not False
 
 
-def merge_new_strings(strings: Dict[str, Any], new_strings: Dict[str, Dict[str, str]]) -> int:
+def merge_new_strings(strings: dict[str, Any], new_strings: dict[str, dict[str, str]]) -> int:
     """
     Ensure explicitly provided translations exist, including English anchors.
     The structure mirrors NEW_STRINGS used by the legacy scripts:
@@ -98,7 +126,7 @@ def merge_new_strings(strings: Dict[str, Any], new_strings: Dict[str, Dict[str,
     return applied
 
 
-def collect_languages(strings: Dict[str, Any]) -> set:
+def collect_languages(strings: dict[str, Any]) -> set:
     """Collect language codes present in any string entry."""
     languages = set()
     for value in strings.values():
@@ -108,18 +136,20 @@ def collect_languages(strings: Dict[str, Any]) -> set:
 
 
 def update_missing_translations(
-    data: Dict[str, Any],
-    new_strings: Optional[Dict[str, Dict[str, str]]] = None,
-    keep_languages: Optional[Iterable[str]] = None,
-) -> Dict[str, int]:
+    data: dict[str, Any],
+    new_strings: dict[str, dict[str, str]] | None = None,
+    keep_languages: Iterable[str] | None = None,
+) -> dict[str, int]:
     """
     Fill missing English anchors and apply explicit translations.
 
     This intentionally avoids clearing or adding placeholder entries so
-    manual translation work is preserved.
+    manual translation work is preserved. A compacted catalog is compacted
+    again afterwards, and cells that drops are not counted.
     """
     new_strings = new_strings or {}
     strings = data["strings"]
+    compacted = _is_compacted(data)
 
     merged_count = merge_new_strings(strings, new_strings)
 
@@ -175,12 +205,19 @@ def update_missing_translations(
             }
             counts["applied_translations"] += 1
 
+    if compacted:
+        # Cells folded back into identity rows were not really applied.
+        compacted_counts = compact_strings(data)
+        counts["added_en"] = 0
+        counts["applied_translations"] = max(
+            0, counts["applied_translations"] - compacted_counts["identity_cells"]
+        )
     return counts
 
 
 def apply_translation_map(
-    data: Dict[str, Any],
-    translation_map: Dict[str, str],
+    data: dict[str, Any],
+    translation_map: dict[str, str],
     target_language: str = "zh-Hans",
 ) -> int:
     """Apply a one-to-one English → target language translation map."""
@@ -210,16 +247,103 @@ def apply_translation_map(
     return applied
 
 
+class LocaleFallbacks:
+    """
+    Precomputed fallback chains, e.g. zh-HK → zh-Hant or es-MX → es.
+
+    Chains stop before the source language: falling back to English is what
+    the user sees when a string is untranslated, so it never counts as coverage.
+    """
+
+    def __init__(
+        self,
+        locales: Iterable[str] = (),
+        parents: dict[str, str | None] | None = None,
+        source_language: str = "en",
+    ) -> None:
+        self.parents = dict(DEFAULT_LOCALE_PARENTS if parents is None else parents)
+        self.source_language = source_language
+        self.chains: dict[str, tuple[str, ...]] = {}
+        self._order: list[tuple[str, str | None]] = []
+        self.add(locales)
+
+    def _parent(self, locale: str) -> str | None:
+        if locale in self.parents:
+            return self.parents[locale]
+        if "-" in locale:
+            return locale.rsplit("-", 1)[0]
+        return None
+
+    def add(self, locales: Iterable[str]) -> None:
+        """Compute chains for new locales (and every ancestor they reach)."""
+        pending = [locale for locale in locales if locale not in self.chains]
+        if not pending:
+            return
+        for locale in pending:
+            chain = [locale]
+            parent = self._parent(locale)
+            while parent and parent != self.source_language and parent not in chain:
+                chain.append(parent)
+                parent = self._parent(parent)
+            for index, member in enumerate(chain):
+                self.chains.setdefault(member, tuple(chain[index:]))
+
+        # Parents before children, so resolve() can reuse a parent's result.
+        self._order = [
+            (locale, chain[1] if len(chain) > 1 else None)
+            for locale, chain in sorted(self.chains.items(), key=lambda item: len(item[1]))
+        ]
+
+    def chain(self, locale: str) -> tuple[str, ...]:
+        self.add([locale])
+        return self.chains[locale]
+
+    def resolve(
+        self,
+        locs: dict[str, Any],
+        is_complete: Callable[[dict[str, Any]], bool],
+    ) -> dict[str, str | None]:
+        """
+        Map every known locale to the locale whose value a user actually sees
+        for this entry, or None when it falls through to the source language.
+        Each locale is decided once from its parent's result, so chains are
+        not re-walked per cell.
+        """
+        resolved: dict[str, str | None] = {}
+        for locale, parent in self._order:
+            unit = locs.get(locale, {}).get("stringUnit")
+            if unit and is_complete(unit):
+                resolved[locale] = locale
+            else:
+                resolved[locale] = resolved[parent] if parent else None
+        return resolved
+
+
+def has_value(unit: dict[str, Any]) -> bool:
+    return bool(unit.get("value", "").strip())
+
+
+def is_translated(unit: dict[str, Any]) -> bool:
+    return unit.get("state") == "translated" and has_value(unit)
+
+
 def find_untranslated(
-    data: Dict[str, Any],
-    target_langs: Optional[Iterable[str]] = None,
-    exceptions: Optional[Iterable[str]] = None,
-) -> List[Dict[str, Any]]:
-    """Return entries where target languages are missing or have empty values."""
+    data: dict[str, Any],
+    target_langs: Iterable[str] | None = None,
+    exceptions: Iterable[str] | None = None,
+    fallbacks: LocaleFallbacks | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Return entries where target languages are missing or have empty values.
+    With `fallbacks`, a language is only reported when no locale in its
+    fallback chain provides a value either.
+    """
     target_langs = set(target_langs or DEFAULT_KEEP_LANGUAGES)
+    if fallbacks:
+        fallbacks.add(target_langs)
     exceptions = set(exceptions or [])
     strings = data["strings"]
-    untranslated: List[Dict[str, Any]] = []
+    untranslated: list[dict[str, Any]] = []
 
     for key, value in strings.items():
         if not should_translate(value):
@@ -228,15 +352,19 @@ def find_untranslated(
             continue
 
         locs = value.get("localizations", {})
-        missing_langs: List[str] = []
+        missing_langs: list[str] = []
 
-        for lang in target_langs:
-            target_unit = locs.get(lang, {}).get("stringUnit", {})
-            target_value = target_unit.get("value", "").strip()
+        if fallbacks:
+            resolved = fallbacks.resolve(locs, has_value)
+            missing_langs = [lang for lang in target_langs if resolved[lang] is None]
+        else:
+            for lang in target_langs:
+                target_unit = locs.get(lang, {}).get("stringUnit", {})
+                target_value = target_unit.get("value", "").strip()
 
-            # Report if target is missing or empty
-            if not target_value:
-                missing_langs.append(lang)
+                # Report if target is missing or empty
+                if not target_value:
+                    missing_langs.append(lang)
 
         if missing_langs:
             untranslated.append({"key": key, "missing": sorted(missing_langs)})
@@ -244,10 +372,10 @@ def find_untranslated(
     return untranslated
 
 
-def prune_stale_strings(data: Dict[str, Any]) -> List[str]:
+def prune_stale_strings(data: dict[str, Any]) -> list[str]:
     """Remove entries marked extractionState=stale; returns removed keys."""
     strings = data["strings"]
-    removed: List[str] = []
+    removed: list[str] = []
     for key in list(strings.keys()):
         if strings[key].get("extractionState") == "stale":
             removed.append(key)
@@ -256,11 +384,14 @@ def prune_stale_strings(data: Dict[str, Any]) -> List[str]:
 
 
 def find_incomplete_translations(
-    data: Dict[str, Any],
+    data: dict[str, Any],
     clean_stale: bool = True,
-) -> Tuple[List[str], List[Tuple[str, str, str]], List[str]]:
+    fallbacks: LocaleFallbacks | None = None,
+) -> tuple[list[str], list[tuple[str, str, str]], list[str]]:
     """
     Find missing/empty/non-translated entries.
+    With `fallbacks`, cells covered by a translated locale further up their
+    fallback chain are not reported.
     Returns (languages, incomplete list, removed_stale_keys)
     """
     removed = prune_stale_strings(data) if clean_stale else []
@@ -268,11 +399,17 @@ def find_incomplete_translations(
     translatable = {k: v for k, v in strings.items() if should_translate(v)}
 
     languages = sorted(collect_languages(translatable))
-    incomplete: List[Tuple[str, str, str]] = []
+    incomplete: list[tuple[str, str, str]] = []
+    if fallbacks:
+        fallbacks.add(languages)
 
     for key, value in translatable.items():
         locs = value.get("localizations", {})
+        resolved = fallbacks.resolve(locs, is_translated) if fallbacks else {}
         for lang in languages:
+            provider = resolved.get(lang)
+            if provider and provider != lang:
+                continue
             unit = locs.get(lang, {}).get("stringUnit")
             if not unit:
                 incomplete.append((key, lang, "missing localization"))
@@ -288,7 +425,125 @@ def find_incomplete_translations(
     return languages, incomplete, removed
 
 
-def print_update_summary(file_path: str, counts: Dict[str, int]) -> None:
+def _is_plain_unit(cell: dict[str, Any], value: str) -> bool:
+    """True for a bare translated stringUnit holding exactly `value`."""
+    unit = cell.get("stringUnit")
+    return (
+        set(cell) == {"stringUnit"}
+        and set(unit) == {"state", "value"}
+        and unit["state"] == "translated"
+        and unit["value"] == value
+    )
+
+
+def compact_strings(data: dict[str, Any]) -> dict[str, int]:
+    """
+    Drop cells Xcode derives on its own, without changing runtime strings:
+    - English anchors whose value equals the key (lookups fall back to the key)
+    - rows where every other language repeats English, e.g. URLs; these
+      become shouldTranslate=false and fall back to English at runtime
+    Returns counts of removed cells.
+    """
+    source = data.get("sourceLanguage", "en")
+    strings = data["strings"]
+    counts = {"en_anchors": 0, "identity_cells": 0, "identity_entries": 0}
+    # Only rows complete in every checked language collapse, so a row with
+    # gaps keeps being reported by the checks.
+    required = (collect_languages(strings) | DEFAULT_KEEP_LANGUAGES) - {source}
+
+    identity_keys = set()
+    for key, value in strings.items():
+        locs = value.get("localizations")
+        if not locs or not should_translate(value) or value.get("extractionState") == "stale":
+            continue
+        source_cell = locs.get(source)
+        source_unit = source_cell.get("stringUnit", {}) if source_cell else {"state": "translated"}
+        english_value = source_unit.get("value", key)
+        others = [lang for lang in locs if lang != source]
+        if (
+            source_unit.get("state") == "translated"
+            and english_value
+            and english_value.strip()
+            and set(others) >= required
+            and all(_is_plain_unit(locs[lang], english_value) for lang in others)
+        ):
+            identity_keys.add(key)
+
+    # The checks derive their language list from translatable rows; keep it intact.
+    remaining = collect_languages(
+        {
+            key: value
+            for key, value in strings.items()
+            if key not in identity_keys
+            and should_translate(value)
+            and value.get("extractionState") != "stale"
+        }
+    )
+    if not required <= remaining:
+        identity_keys.clear()
+
+    for key, value in strings.items():
+        locs = value.get("localizations")
+        if not locs:
+            continue
+
+        if key in identity_keys:
+            others = [lang for lang in locs if lang != source]
+            for lang in others:
+                del locs[lang]
+            value["shouldTranslate"] = False
+            counts["identity_cells"] += len(others)
+            counts["identity_entries"] += 1
+
+        source_cell = locs.get(source)
+        if source_cell and _is_plain_unit(source_cell, key):
+            del locs[source]
+            counts["en_anchors"] += 1
+
+        if not locs:
+            del value["localizations"]
+    return counts
+
+
+def _is_compacted(data: dict[str, Any]) -> bool:
+    """True for a catalog in the shape compact_strings leaves: no anchor equals its key."""
+    source = data.get("sourceLanguage", "en")
+    missing = False
+    for key, value in data["strings"].items():
+        source_cell = value.get("localizations", {}).get(source)
+        if source_cell is None:
+            missing = True
+        elif _is_plain_unit(source_cell, key):
+            return False
+    return missing
+
+
+def expand_strings(data: dict[str, Any]) -> int:
+    """
+    Give every entry without a source-language cell an anchor holding its
+    key, which is what Xcode shows at runtime, so checks see compacted and
+    anchored catalogs alike. A missing English cell is therefore never
+    reported as missing. Rows compacted to shouldTranslate=false stay that
+    way; the checks skip them just like Xcode does.
+    Returns the number of anchors restored.
+    """
+    source = data.get("sourceLanguage", "en")
+    restored = 0
+    for key, value in data["strings"].items():
+        locs = value.setdefault("localizations", {})
+        if source in locs:
+            continue
+        locs[source] = {
+            "stringUnit": {
+                "state": "translated",
+                "value": key,
+            }
+        }
+        restored += 1
+    return restored
+
+
+def print_update_summary(file_path: str, counts: dict[str, int]) -> None:
     print(f"✅ Updated {file_path}")
     print(f"   - Added {counts['added_en']} missing English localizations")
     print(f"   - Fixed {counts['fixed_en_state']} 'new' English states")
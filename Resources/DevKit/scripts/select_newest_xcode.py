@@ -2,64 +2,17 @@
 
 from __future__ import annotations
 
-import plistlib
+import argparse
 import subprocess
 import sys
 from pathlib import Path
 
-APPLICATIONS_DIR = Path("/Applications")
+from xcode_inventory import CHANNELS, XcodeInventory, default_roots
 
 
 def log(message: str) -> None:
-    print(f"[select-xcode] {message}")
-
-
-def version_key(value: str) -> tuple:
-    parts = []
-    for segment in value.split('.'):
-        parts.append(int(segment) if segment.isdigit() else segment)
-    return tuple(parts)
-
-
-def discover_xcodes() -> list[Path]:
-    if not APPLICATIONS_DIR.is_dir():
-        return []
-    bundles = []
-    for path in APPLICATIONS_DIR.iterdir():
-        if not path.is_dir() or not path.name.startswith("Xcode") or path.suffix != ".app":
-            continue
-        if "beta" in path.name.lower():
-            log(f"skipping {path} (beta build)")
-            continue
-        bundles.append(path)
-    return sorted(bundles, key=lambda p: p.name)
-
-
-def read_metadata(bundle: Path):
-    plist_path = bundle / "Contents/Info.plist"
-    if not plist_path.is_file():
-        log(f"skipping {bundle} (no Info.plist)")
-        return None
-    try:
-        with plist_path.open("rb") as handle:
-            plist = plistlib.load(handle)
-    except Exception as exc:  # noqa: BLE001
-        log(f"skipping {bundle} (plist error: {exc})")
-        return None
-
-    version = str(plist.get("CFBundleShortVersionString", "")).strip()
-    build = str(plist.get("CFBundleVersion", "")).strip()
-
-    if not version:
-        log(f"skipping {bundle} (no version)")
-        return None
-
-    return {
-        "path": bundle,
-        "version": version,
-        "build": build,
-        "sort_key": (version_key(version), version_key(build) if build else ()),
-    }
+    # stderr, like xcode_inventory, so --list output stays machine-readable.
+    print(f"[select-xcode] {message}", file=sys.stderr)
 
 
 def select_newest(candidates):
@@ -68,18 +21,51 @@ def select_newest(candidates):
     return sorted(candidates, key=lambda item: item["sort_key"])[-1]
 
 
-def main() -> int:
-    bundles = discover_xcodes()
-    if not bundles:
-        print("[-] no Xcode installations found under /Applications", file=sys.stderr)
+def parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Select the newest installed Xcode.")
+    parser.add_argument(
+        "--root",
+        action="append",
+        type=Path,
+        dest="roots",
+        help="directory to scan for Xcode*.app (repeatable, default: /Applications "
+        "or $SUBZEN_XCODE_ROOTS)",
+    )
+    parser.add_argument("--include-beta", action="store_true", help="consider beta builds")
+    parser.add_argument(
+        "--channel",
+        action="append",
+        choices=CHANNELS,
+        dest="channels",
+        help="only consider these channels (repeatable)",
+    )
+    parser.add_argument("--list", action="store_true", help="print ranked installs and exit")
+    parser.add_argument("--no-cache", action="store_true", help="ignore the metadata cache")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    roots = args.roots or default_roots()
+    inventory = XcodeInventory(roots=roots, use_cache=not args.no_cache)
+
+    installs = inventory.refresh()
+    if not installs:
+        searched = ", ".join(str(root) for root in roots)
+        print(f"[-] no Xcode installations with readable versions found under {searched}", file=sys.stderr)
         return 1
 
-    candidates = [meta for meta in (read_metadata(bundle) for bundle in bundles) if meta]
-    if not candidates:
-        print("[-] no Xcode installations with readable versions found", file=sys.stderr)
-        return 1
+    ranked = inventory.query(include_beta=args.include_beta, channels=args.channels)
+    if args.list:
+        for install in ranked:
+            print(f"{install['version']}\t{install['build']}\t{install['channel']}\t{install['path']}")
+        return 0
 
-    newest = select_newest(candidates)
+    for install in installs:
+        if install not in ranked:
+            log(f"skipping {install['path']} ({install['channel']} build)")
+
+    newest = select_newest(ranked)
     if not newest:
         print("[-] failed to determine newest Xcode", file=sys.stderr)
         return 1
@@ -93,9 +79,18 @@ def main() -> int:
     log(f"selecting Xcode {newest['version']} (build {newest['build']}) at {xcode_path}")
 
     subprocess.run(["sudo", "xcode-select", "-s", str(developer_dir)], check=True)
-    selected = subprocess.run(["xcode-select", "-p"], check=True, capture_output=True, text=True)
-    log(f"xcode-select set to {selected.stdout.strip()}")
-    subprocess.run(["xcodebuild", "-version"], check=True)
+
+    # Both only read the selection made above, so run them side by side.
+    selected = subprocess.Popen(["xcode-select", "-p"], stdout=subprocess.PIPE, text=True)
+    version = subprocess.Popen(["xcodebuild", "-version"], stdout=subprocess.PIPE, text=True)
+    selected_out, _ = selected.communicate()
+    version_out, _ = version.communicate()
+    for process in (selected, version):
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, process.args)
+
+    log(f"xcode-select set to {selected_out.strip()}")
+    print(version_out, end="")
 
     return 0
 
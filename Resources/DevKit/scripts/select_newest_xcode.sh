@@ -3,4 +3,4 @@
 set -euo pipefail
 
 SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
-exec /usr/bin/env python3 "${SCRIPT_DIR}/select_newest_xcode.py"
+exec /usr/bin/env python3 "${SCRIPT_DIR}/select_newest_xcode.py" "$@"
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Fake-tree tests for xcode_inventory; run anywhere with
+`python3 -m unittest test_xcode_inventory` from this directory.
+"""
+
+from __future__ import annotations
+
+import plistlib
+import tempfile
+import unittest
+from pathlib import Path
+
+from xcode_inventory import XcodeInventory, channel_for
+
+
+def make_bundle(root: Path, name: str, version: str, build: str) -> Path:
+    bundle = root / name
+    contents = bundle / "Contents"
+    contents.mkdir(parents=True)
+    with (contents / "Info.plist").open("wb") as handle:
+        plistlib.dump({"CFBundleShortVersionString": version, "CFBundleVersion": build}, handle)
+    return bundle
+
+
+class ChannelTests(unittest.TestCase):
+    def test_beta_anywhere_in_name(self) -> None:
+        for name in ("Xcode-beta.app", "Xcode26beta.app", "XcodeBeta.app", "Xcode_26_Beta_3.app"):
+            with self.subTest(name=name):
+                self.assertEqual(channel_for(Path(name)), "beta")
+
+    def test_release_candidate_after_version(self) -> None:
+        for name in (
+            "Xcode_16_RC.app",
+            "Xcode16RC.app",
+            "Xcode16.1rc2.app",
+            "Xcode-16-Release-Candidate.app",
+            "Xcode16candidate.app",
+            "Xcode_RC.app",
+        ):
+            with self.subTest(name=name):
+                self.assertEqual(channel_for(Path(name)), "rc")
+
+    def test_release(self) -> None:
+        for name in ("Xcode.app", "Xcode_16.2.app", "Xcode-Orca.app", "Xcode16rcade.app"):
+            with self.subTest(name=name):
+                self.assertEqual(channel_for(Path(name)), "release")
+
+
+class InventoryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp = tempfile.TemporaryDirectory()
+        base = Path(self.temp.name)
+        self.applications = base / "Applications"
+        self.extra = base / "Volumes" / "Xcodes"
+        make_bundle(self.applications, "Xcode.app", "16.2", "16C5032a")
+        make_bundle(self.applications, "Xcode26beta.app", "26.0", "17A5241e")
+        make_bundle(self.extra, "Xcode_16.3_RC.app", "16.3", "16E137")
+        make_bundle(self.extra, "Xcode_16.1.app", "16.1", "16B40")
+        self.cache_path = base / "cache" / "xcode-inventory.json"
+
+    def tearDown(self) -> None:
+        self.temp.cleanup()
+
+    def inventory(self) -> XcodeInventory:
+        return XcodeInventory(roots=[self.applications, self.extra], cache_path=self.cache_path)
+
+    def test_default_skips_beta(self) -> None:
+        newest = self.inventory().newest()
+        self.assertEqual(newest["path"].name, "Xcode_16.3_RC.app")
+
+    def test_include_beta(self) -> None:
+        newest = self.inventory().newest(include_beta=True)
+        self.assertEqual(newest["path"].name, "Xcode26beta.app")
+
+    def test_channels(self) -> None:
+        ranked = self.inventory().query(channels=["release"])
+        self.assertEqual([item["path"].name for item in ranked], ["Xcode.app", "Xcode_16.1.app"])
+
+    def test_cache_skips_unchanged_plists(self) -> None:
+        first = self.inventory()
+        first.refresh()
+        self.assertEqual(first.parsed, 4)
+
+        second = self.inventory()
+        self.assertEqual(len(second.refresh()), 4)
+        self.assertEqual(second.parsed, 0)
+
+        # Replacing one bundle's plist reparses only that bundle.
+        plist_path = self.applications / "Xcode.app" / "Contents" / "Info.plist"
+        plist_path.unlink()
+        with plist_path.open("wb") as handle:
+            plistlib.dump({"CFBundleShortVersionString": "16.4", "CFBundleVersion": "16F6"}, handle)
+        third = self.inventory()
+        self.assertEqual(third.newest()["version"], "16.4")
+        self.assertEqual(third.parsed, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
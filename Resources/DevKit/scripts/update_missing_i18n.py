@@ -4,6 +4,7 @@ Update missing i18n translations in Localizable.xcstrings.
 This script adds missing English localizations and fixes 'new' state translations.
 """
 
+import argparse
 import sys
 
 from i18n_tools import (
@@ -353,8 +354,11 @@ REMOVED_STRINGS: set[str] = {
     "Stop Renewing",
 }
 
-if __name__ == "__main__":
-    file_path = sys.argv[1] if len(sys.argv) > 1 else default_file_path()
+
+def main(argv=None, prog=None) -> int:
+    parser = argparse.ArgumentParser(prog=prog, description=__doc__.strip())
+    parser.add_argument("file", nargs="?", default=default_file_path())
+    file_path = parser.parse_args(argv).file
 
     data = load_strings(file_path)
     removed_keys: list[str] = []
@@ -376,3 +380,8 @@ if __name__ == "__main__":
         print("Removed keys:")
         for key in sorted(removed_keys):
             print(f"  - {key}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
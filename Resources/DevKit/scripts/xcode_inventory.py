@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+
+from __future__ import annotations
+
+import json
+import os
+import plistlib
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+DEFAULT_ROOTS = (Path("/Applications"),)
+# os.pathsep separated list of directories to scan instead of DEFAULT_ROOTS.
+ROOTS_ENV = "SUBZEN_XCODE_ROOTS"
+CACHE_ENV = "SUBZEN_XCODE_CACHE"
+CACHE_VERSION = 1
+
+CHANNELS = ("release", "rc", "beta")
+
+
+def log(message: str) -> None:
+    print(f"[xcode-inventory] {message}", file=sys.stderr)
+
+
+def version_key(value: str) -> tuple:
+    parts = []
+    for segment in value.split('.'):
+        parts.append(int(segment) if segment.isdigit() else segment)
+    return tuple(parts)
+
+
+def default_roots() -> list[Path]:
+    configured = os.environ.get(ROOTS_ENV, "")
+    roots = [Path(item).expanduser() for item in configured.split(os.pathsep) if item]
+    return roots or list(DEFAULT_ROOTS)
+
+
+def default_cache_path() -> Path:
+    configured = os.environ.get(CACHE_ENV)
+    if configured:
+        return Path(configured).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "subzen" / "xcode-inventory.json"
+
+
+# "rc" or "candidate" right after a version, e.g. Xcode_16_RC, Xcode16.1rc2 or
+# Xcode-16-Release-Candidate; a lone "rc" token also counts.
+RC_PATTERN = re.compile(
+    r"(?:\d[^a-z0-9]*|^|[^a-z0-9])(?:rc|(?:release[^a-z0-9]*)?candidate)\d*(?:[^a-z]|$)"
+)
+
+
+def channel_for(bundle: Path) -> str:
+    """Classify a bundle by its name, e.g. Xcode-beta.app or Xcode_16_RC.app."""
+    name = bundle.stem.lower()
+    # Any mention of beta, as in Xcode26beta.app, keeps the build out of default picks.
+    if "beta" in name:
+        return "beta"
+    if RC_PATTERN.search(name):
+        return "rc"
+    return "release"
+
+
+def scan_root(root: Path) -> list[Path]:
+    if not root.is_dir():
+        return []
+    try:
+        entries = list(root.iterdir())
+    except OSError as exc:
+        log(f"skipping {root} ({exc})")
+        return []
+    return [
+        path for path in entries
+        if path.name.startswith("Xcode") and path.suffix == ".app" and path.is_dir()
+    ]
+
+
+class XcodeInventory:
+    """
+    Installed Xcode bundles across several roots.
+
+    Info.plist metadata is cached on disk keyed by the plist's mtime and inode,
+    so a refresh only parses bundles that were added or replaced since the
+    last run. Roots are scanned and plists read on a thread pool.
+    """
+
+    def __init__(
+        self,
+        roots: list[Path] | None = None,
+        cache_path: Path | None = None,
+        use_cache: bool = True,
+    ) -> None:
+        self.roots = [Path(root) for root in (roots or default_roots())]
+        self.cache_path = cache_path or default_cache_path()
+        self.use_cache = use_cache
+        self.parsed = 0
+        self._installs: list[dict] | None = None
+
+    def _load_cache(self) -> dict:
+        if not self.use_cache:
+            return {}
+        try:
+            with self.cache_path.open("r", encoding="utf-8") as handle:
+                cache = json.load(handle)
+        except (OSError, ValueError):
+            return {}
+        if cache.get("version") != CACHE_VERSION:
+            return {}
+        return cache.get("plists", {})
+
+    def _save_cache(self, plists: dict) -> None:
+        if not self.use_cache:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_path.with_suffix(".tmp")
+            with temp_path.open("w", encoding="utf-8") as handle:
+                json.dump({"version": CACHE_VERSION, "plists": plists}, handle, indent=2)
+            os.replace(temp_path, self.cache_path)
+        except OSError as exc:
+            log(f"could not write cache {self.cache_path} ({exc})")
+
+    def _read_metadata(self, bundle: Path, cache: dict) -> tuple[dict | None, dict | None]:
+        """Return (install record, cache entry) for a bundle."""
+        plist_path = bundle / "Contents/Info.plist"
+        try:
+            stat = plist_path.stat()
+        except OSError:
+            log(f"skipping {bundle} (no Info.plist)")
+            return None, None
+
+        cached = cache.get(str(plist_path))
+        if cached and cached["mtime_ns"] == stat.st_mtime_ns and cached["ino"] == stat.st_ino:
+            entry = cached
+        else:
+            try:
+                with plist_path.open("rb") as handle:
+                    plist = plistlib.load(handle)
+            except Exception as exc:  # noqa: BLE001
+                log(f"skipping {bundle} (plist error: {exc})")
+                return None, None
+            entry = {
+                "mtime_ns": stat.st_mtime_ns,
+                "ino": stat.st_ino,
+                "version": str(plist.get("CFBundleShortVersionString", "")).strip(),
+                "build": str(plist.get("CFBundleVersion", "")).strip(),
+            }
+
+        version, build = entry["version"], entry["build"]
+        if not version:
+            log(f"skipping {bundle} (no version)")
+            return None, entry
+
+        install = {
+            "path": bundle,
+            "version": version,
+            "build": build,
+            "channel": channel_for(bundle),
+            "sort_key": (version_key(version), version_key(build) if build else ()),
+        }
+        return install, entry
+
+    def refresh(self) -> list[dict]:
+        """Rescan every root and return all readable installs, oldest first."""
+        cache = self._load_cache()
+
+        with ThreadPoolExecutor() as pool:
+            bundles: dict[str, Path] = {}
+            for found in pool.map(scan_root, self.roots):
+                for bundle in found:
+                    # The same bundle may be reachable from several roots via symlinks.
+                    bundles.setdefault(os.path.realpath(bundle), bundle)
+            ordered = sorted(bundles.values(), key=lambda p: (p.name, str(p)))
+            results = list(pool.map(lambda bundle: self._read_metadata(bundle, cache), ordered))
+
+        # Counted here rather than in the workers: a reused entry is the cached object.
+        self.parsed = 0
+        plists: dict = {}
+        installs = []
+        for bundle, (install, entry) in zip(ordered, results):
+            if entry is not None:
+                plist_key = str(bundle / "Contents/Info.plist")
+                if entry is not cache.get(plist_key):
+                    self.parsed += 1
+                plists[plist_key] = entry
+            if install is not None:
+                installs.append(install)
+
+        if plists != cache:
+            self._save_cache(plists)
+
+        self._installs = sorted(installs, key=lambda item: item["sort_key"])
+        return self._installs
+
+    def query(
+        self,
+        include_beta: bool = False,
+        channels: list[str] | None = None,
+    ) -> list[dict]:
+        """
+        Installs ranked by version_key, newest first.
+        Betas are excluded unless requested; `channels` restricts further.
+        """
+        if self._installs is None:
+            self.refresh()
+        selected = []
+        for install in reversed(self._installs):
+            if channels is not None:
+                if install["channel"] not in channels:
+                    continue
+            elif install["channel"] == "beta" and not include_beta:
+                continue
+            selected.append(install)
+        return selected
+
+    def newest(self, include_beta: bool = False, channels: list[str] | None = None):
+        ranked = self.query(include_beta=include_beta, channels=channels)
+        return ranked[0] if ranked else None